@@ -15,6 +15,7 @@ from __future__ import absolute_import, division, print_function, with_statement
 
 import os
 import inspect
+import logging
 
 import tornado.web
 import tornado.httpserver
@@ -37,6 +38,7 @@ import rw.event
 
 PRE_REQUEST = rw.event.Event('httpbase.pre_request')
 POST_REQUEST = rw.event.Event('httpbase.post_request')
+ACCESS_LOG = logging.getLogger('rw.access')
 
 
 class Application(tornado.routing.ReversibleRouter):
@@ -60,11 +62,12 @@ class Application(tornado.routing.ReversibleRouter):
             self.scope['settings'] = rw.cfg.read_configs(self.root.name,
                                                          self.extra_configs)
 
-            pkgs = self.scope['settings'].get('rw.templates', {}).get('pkgs', None)
+            cfg_templates = self.scope['settings'].get('rw.templates', {})
+            pkgs = cfg_templates.get('pkgs', None)
             if not pkgs:
                 pkgs = [root.name]
 
-            self.scope['template_env'] = rw.template.create_template_env(pkgs)
+            self.scope['template_env'] = rw.template.create_template_env(pkgs, cfg_templates)
             self.scope['template_env'].globals['app'] = self
         else:
             self.handler = handler
@@ -91,6 +94,9 @@ class Application(tornado.routing.ReversibleRouter):
 
         yield self.scope.activate(self.root)
 
+        if self.rw_settings.get('rw.templates', {}).get('precompile', False):
+            rw.template.precompile(self.scope['template_env'])
+
     def _configure_cookie_secret(self):
         cfg = self.rw_settings['rw.http']
         if 'cookie_secret' in cfg:
@@ -134,9 +140,22 @@ class Application(tornado.routing.ReversibleRouter):
         # request handling
         request_future.result()
 
-    def log_request(self, request):
-        # TODO print(request)
-        pass
+    def log_request(self, handler):
+        """Log a finished request to the ``rw.access`` logger"""
+        status = handler.get_status()
+        if status < 400:
+            level = logging.INFO
+        elif status < 500:
+            level = logging.WARNING
+        else:
+            level = logging.ERROR
+
+        # skip formatting if nobody is listening
+        if ACCESS_LOG.isEnabledFor(level):
+            request = handler.request
+            ACCESS_LOG.log(level, '%d %s %s (%s) %.2fms', status,
+                           request.method, request.uri, request.remote_ip,
+                           1000.0 * request.request_time())
 
 
 class RequestDispatcher(tornado.httputil.HTTPMessageDelegate):
@@ -191,6 +210,10 @@ class RequestDispatcher(tornado.httputil.HTTPMessageDelegate):
 
 
 class RequestHandler(tornado.web.RequestHandler, dict):
+    #: set to `False` to skip hashing the response body for an ETag header,
+    #: e.g. for API handlers that never get conditional requests
+    generate_etag = True
+
     def __init__(self, application, request, **kwargs):
         # The super class is not called since it creates
         # some structures we do not care about.  Since
@@ -243,6 +266,33 @@ class RequestHandler(tornado.web.RequestHandler, dict):
 
         tornado.web.RequestHandler.send_error(self, status_code, **kwargs)
 
+    def clear(self):
+        tornado.web.RequestHandler.clear(self)
+        self._content_length = 0
+
+    def write(self, chunk):
+        tornado.web.RequestHandler.write(self, chunk)
+        self._content_length += len(self._write_buffer[-1])
+
+    def finish(self, chunk=None):
+        if self._finished:
+            raise RuntimeError("finish() called twice")
+
+        if chunk is not None:
+            self.write(chunk)
+
+        # the length is tracked while writing so tornado does
+        # not need to sum up the write buffer
+        if not self._headers_written and 'Content-Length' not in self._headers:
+            self.set_header('Content-Length', self._content_length)
+
+        return tornado.web.RequestHandler.finish(self)
+
+    def compute_etag(self):
+        if not self.generate_etag:
+            return None
+        return tornado.web.RequestHandler.compute_etag(self)
+
     def handle_request(self):
         routing_table = rw.scope.get('rw.http')['routing_table']
         prefix, module, fn, args = routing_table.find_route(self.request.method, self.request.path)
@@ -14,6 +14,7 @@
 from __future__ import absolute_import, division, print_function, with_statement
 
 import re
+import collections
 
 from future.builtins import range
 from tornado import util
@@ -36,6 +37,9 @@ _rule_re = re.compile(r'''
 ''', re.VERBOSE)
 _simple_rule_re = re.compile(r'<([^>]+)>')
 
+# maximum number of (method, path) lookups remembered per RoutingTable
+ROUTE_CACHE_SIZE = 4096
+
 
 class DuplicateError(Exception):
     pass
@@ -181,7 +185,9 @@ def _generate_request_handler_proxy(handler_class, handler_args, name):
     @scope.inject
     def request_handler_wrapper(app, handler, **kwargs):
         handler = handler_class(app, handler.request, **handler_args)
-        handler._execute([], **kwargs)
+        # return the future so the request (and its scope) is only done
+        # once the mounted handler finished
+        return handler._execute([], **kwargs)
     request_handler_wrapper.__name__ = name
     request_handler_wrapper.handler_class = handler_class
     request_handler_wrapper.handler_args = handler_args
@@ -196,11 +202,13 @@ class RoutingTable(dict):
         self.prefix = ''
         self.sub_rt = []  # child routing tables
         self.fn_namespace = {}
+        self._route_cache = collections.OrderedDict()
         for method in ['get', 'post', 'put', 'delete', 'options']:
             self[method] = []
 
     def setup(self):
         """setup routing table"""
+        self._route_cache.clear()
         # get all routes from submodules
         for prefix, routes in self.sub_rt:
             routes.prefix = self.prefix + prefix
@@ -231,6 +239,7 @@ class RoutingTable(dict):
     def add_route(self, method, path, module, fn):
         route = Route(path)
         self.setdefault(method, []).append((route, '', module, fn))
+        self._route_cache.clear()
         # if fn.__name__ in self.fn_namespace:
         #     msg = 'Module already contains route with name {}'.format(fn.__name__)
         #     raise DuplicateError(msg)
@@ -270,6 +279,32 @@ class RoutingTable(dict):
         self.sub_rt.append((path, rt))
 
     def find_route(self, method, path):
+        """Find the route for `method` and `path`
+
+        Matches are cached, so routes must not depend on anything
+        but the path (see the converters registered in `init`).
+        The cache is reset by `setup` and `add_route`.
+
+        :return: tuple of ``(name_prefix, module, fn, args)``
+        """
+        key = (method, path)
+        cache = self._route_cache
+        try:
+            name_prefix, module, fn, args = cache.pop(key)
+        except KeyError:
+            name_prefix, module, fn, args = self._find_route(method, path)
+            if fn is None:
+                # do not let unknown paths push out known routes
+                return name_prefix, module, fn, args
+            if len(cache) >= ROUTE_CACHE_SIZE:
+                # drop least recently used entry
+                cache.popitem(last=False)
+        cache[key] = name_prefix, module, fn, args
+
+        # the caller owns the returned arguments
+        return name_prefix, module, fn, dict(args)
+
+    def _find_route(self, method, path):
         for x in self[method.lower()]:
             rule, name_prefix, module, fn = x
             args = rule.match(path)
@@ -319,6 +354,9 @@ plugin = rw.plugin.Plugin(__name__)
 
 @plugin.init
 def init(scope):
+    # Converters must be pure functions of the path they get passed,
+    # `RoutingTable.find_route` caches their results per path.
+    # This applies to custom converters added to this dict as well.
     scope.setdefault('rw.routing:converters', {}).update({
         'str': converter_default,
         'int': converter_int,
@@ -6,21 +6,137 @@ but is based on Jinja2.
 Added methods inside functions:
  * url_for
  * handler
+
+Added tags:
+ * part (see `CachedPartExtension`)
 """
+import os
 import json
+import time
+import collections
 
 import tornado.util
 import jinja2
+import jinja2.ext
+from jinja2 import nodes
 
 import rw.http
 
 
-def create_template_env(pkgs):
+class FragmentCache(object):
+    """Simple in-process cache for rendered template fragments
+
+    Entries are evicted least recently used first once `maxsize` is
+    reached.  An entry added with a `timeout` (in seconds) is discarded
+    once it is older than that.
+    """
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self._data = collections.OrderedDict()
+
+    def get(self, key):
+        entry = self._data.pop(key, None)
+        if entry is None:
+            return None
+        value, expires = entry
+        if expires is not None and expires < time.time():
+            return None
+        # re-insert to mark as most recently used
+        self._data[key] = entry
+        return value
+
+    def add(self, key, value, timeout=None):
+        expires = None if timeout is None else time.time() + timeout
+        self._data.pop(key, None)
+        self._data[key] = (value, expires)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self):
+        self._data.clear()
+
+
+class CachedPartExtension(jinja2.ext.Extension):
+    """Cache the rendered output of a part of a template
+
+    Example usage::
+
+        {% part 'sidebar', 300 %}
+            ... expensive to render ...
+        {% endpart %}
+
+    The first argument is the cache key, the optional second argument
+    a timeout in seconds.  The cache used is `environment.fragment_cache`,
+    set it to `None` to disable caching.
+
+    A part is cached by its name only.  The cached output is shared by
+    all templates, render contexts and locales using the same name, and
+    it stays stale after the template is edited until the timeout runs
+    out or the process is restarted.
+    """
+    tags = set(['part'])
+
+    def __init__(self, environment):
+        super(CachedPartExtension, self).__init__(environment)
+        environment.extend(
+            fragment_cache_prefix='',
+            fragment_cache=FragmentCache(),
+        )
+
+    def parse(self, parser):
+        lineno = next(parser.stream).lineno
+        args = [parser.parse_expression()]
+
+        if parser.stream.skip_if('comma'):
+            args.append(parser.parse_expression())
+        else:
+            args.append(nodes.Const(None))
+
+        body = parser.parse_statements(['name:endpart'], drop_needle=True)
+        return nodes.CallBlock(self.call_method('_cache_support', args),
+                               [], [], body).set_lineno(lineno)
+
+    def _cache_support(self, name, timeout, caller):
+        cache = self.environment.fragment_cache
+        if cache is None:
+            return caller()
+
+        key = self.environment.fragment_cache_prefix + tornado.util.unicode_type(name)
+        rv = cache.get(key)
+        if rv is not None:
+            return rv
+        rv = caller()
+        cache.add(key, rv, timeout)
+        return rv
+
+
+def create_template_env(pkgs, cfg=None):
+    """Create the jinja2 environment for the given packages
+
+    :param list[str] pkgs: packages to load templates from
+    :param dict cfg: the ``rw.templates`` config section, supported keys are
+                     ``auto_reload``, ``cache_size`` and ``bytecode_cache``
+                     (directory to store compiled templates in)
+    """
+    if cfg is None:
+        cfg = {}
+
+    bytecode_cache = None
+    if cfg.get('bytecode_cache'):
+        cache_dir = cfg['bytecode_cache'].format(**os.environ)
+        if not os.path.exists(cache_dir):
+            os.makedirs(cache_dir)
+        bytecode_cache = jinja2.FileSystemBytecodeCache(cache_dir)
+
     loaders = [jinja2.PackageLoader(pkg, 'templates') for pkg in pkgs]
     template_env = jinja2.Environment(
         loader=jinja2.ChoiceLoader(loaders),
         extensions=['jinja2.ext.loopcontrols',
-                    'jinja2.ext.i18n'],
+                    'jinja2.ext.i18n',
+                    CachedPartExtension],
+        auto_reload=cfg.get('auto_reload', True),
+        cache_size=cfg.get('cache_size', 400),
+        bytecode_cache=bytecode_cache,
     )
     template_env.globals['url_for'] = rw.http.url_for
     template_env.filters['json'] = json.dumps
@@ -43,3 +159,14 @@ def create_template_env(pkgs):
     # filter
 
     return template_env
+
+
+def precompile(template_env, extensions=('html',)):
+    """Load all templates of `template_env` so they are compiled ahead of
+    the first request
+
+    :param jinja2.Environment template_env: environment to warm up
+    :param tuple[str] extensions: file extensions of templates to load
+    """
+    for name in template_env.list_templates(extensions=extensions):
+        template_env.get_template(name)
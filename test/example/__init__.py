@@ -91,6 +91,19 @@ class MainHandler(tornado.web.RequestHandler):
         self.write("Tornado POST")
 
 
+class LazyTornadoHandler(tornado.web.RequestHandler):
+    # uris of finished requests
+    finished = []
+
+    @gen.coroutine
+    def get(self):
+        yield gen.Task(tornado.ioloop.IOLoop.current().add_timeout, time.time())
+        self.write("Tornado lazy GET")
+
+    def on_finish(self):
+        LazyTornadoHandler.finished.append(self.request.uri)
+
+
 sub = rw.http.Module(name='submodule', resources='test.example')
 
 
@@ -106,4 +119,5 @@ def sub_index():
 
 
 root.mount('/tornado', MainHandler)
+root.mount('/tornado_lazy', LazyTornadoHandler)
 root.mount('/sub', sub)
@@ -2,6 +2,7 @@ import imp
 
 import pkg_resources
 import rw.testing
+import rw.httpbase
 
 from . import example
 
@@ -53,6 +54,20 @@ class HTTPServerTest(rw.testing.AsyncHTTPTestCase):
     def test_mount_tornado_handler(self):
         self.check_path('/tornado', u'Tornado GET')
 
+    def test_mount_lazy_tornado_handler(self):
+        finished_on_post_request = []
+
+        def post_request():
+            finished_on_post_request.append(list(example.LazyTornadoHandler.finished))
+
+        rw.httpbase.POST_REQUEST.add(post_request)
+        try:
+            self.check_path('/tornado_lazy', u'Tornado lazy GET')
+        finally:
+            rw.httpbase.POST_REQUEST.discard(post_request)
+        # POST_REQUEST must only fire once the mounted handler is done
+        assert finished_on_post_request == [['/tornado_lazy']]
+
     def test_static(self):
         # from static folder
         base_url = '/static/hash/test.example/'
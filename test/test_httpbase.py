@@ -1,3 +1,5 @@
+import logging
+
 import tornado.web
 from tornado.testing import AsyncHTTPTestCase, AsyncTestCase, ExpectLog, gen_test
 
@@ -17,6 +19,96 @@ class HTTPServerTest(AsyncHTTPTestCase):
         response = self.fetch('/')
         assert response.body.decode('utf-8') == u'Hello World'
 
+    def test_access_log(self):
+        rw.httpbase.ACCESS_LOG.setLevel(logging.INFO)
+        try:
+            with ExpectLog('rw.access', r'200 GET / \(127.0.0.1\) [0-9.]+ms'):
+                self.fetch('/')
+        finally:
+            rw.httpbase.ACCESS_LOG.setLevel(logging.NOTSET)
+
+    def test_unsupported_method(self):
+        response = self.fetch('/', method='PROPFIND', allow_nonstandard_methods=True)
+        assert response.code == 405
+
+
+class HTTPServerXsrfTest(AsyncHTTPTestCase):
+    def get_app(self):
+        app = rw.httpbase.Application(handler=HelloWorldHandler)
+        app.settings['xsrf_cookies'] = True
+        return app
+
+    def test_post_without_xsrf_token(self):
+        response = self.fetch('/', method='POST', body='')
+        assert response.code == 403
+
+    def test_get(self):
+        response = self.fetch('/')
+        assert response.code == 200
+
+
+class PropfindHandler(HelloWorldHandler):
+    SUPPORTED_METHODS = HelloWorldHandler.SUPPORTED_METHODS + ('PROPFIND',)
+
+    def propfind(self):
+        return self.handle_request()
+
+
+class HTTPServerExtraMethodTest(AsyncHTTPTestCase):
+    def get_app(self):
+        return rw.httpbase.Application(handler=PropfindHandler)
+
+    def test_extra_method(self):
+        response = self.fetch('/', method='PROPFIND', allow_nonstandard_methods=True)
+        assert response.body.decode('utf-8') == u'Hello World'
+
+
+class MultipleWritesHandler(rw.httpbase.RequestHandler):
+    def handle_request(self):
+        self.write('Hello')
+        self.write(u' W\xf6rld')
+        self.finish()
+
+
+class NoEtagHandler(HelloWorldHandler):
+    generate_etag = False
+
+
+class HTTPServerEtagTest(AsyncHTTPTestCase):
+    def get_app(self):
+        return rw.httpbase.Application(handler=HelloWorldHandler)
+
+    def test_etag(self):
+        response = self.fetch('/')
+        etag = response.headers['Etag']
+        response = self.fetch('/', headers={'If-None-Match': etag})
+        assert response.code == 304
+
+
+class HTTPServerNoEtagTest(AsyncHTTPTestCase):
+    def get_app(self):
+        return rw.httpbase.Application(handler=NoEtagHandler)
+
+    def test_no_etag(self):
+        response = self.fetch('/')
+        assert response.body.decode('utf-8') == u'Hello World'
+        assert 'Etag' not in response.headers
+
+
+class HTTPServerContentLengthTest(AsyncHTTPTestCase):
+    def get_app(self):
+        return rw.httpbase.Application(handler=MultipleWritesHandler)
+
+    def test_content_length(self):
+        response = self.fetch('/')
+        assert response.body.decode('utf-8') == u'Hello W\xf6rld'
+        assert response.headers['Content-Length'] == '12'
+
+    def test_head(self):
+        response = self.fetch('/', method='HEAD')
+        assert response.body == b''
+        assert response.headers['Content-Length'] == '12'
+
 
 class HTTPServerEventTest(AsyncHTTPTestCase):
     def get_app(self):
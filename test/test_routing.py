@@ -131,6 +131,55 @@ def test_submodules():
         assert func.__name__ == 'fun'
 
 
+def test_find_route_cache():
+    rt = rw.routing.RoutingTable('root')
+    rt.add_route('get', '/', 0, generate_route_func('index'))
+    rt.add_route('get', '/<name>', 0, generate_route_func('user'))
+    rt.setup()
+
+    scope = rw.scope.Scope()
+    scope['rw.routing:converters'] = {'str': rw.routing.converter_default}
+    with scope():
+        prefix, module, func, args = rt.find_route('get', '/joe')
+        assert func.__name__ == 'user'
+        assert args == {'name': 'joe'}
+        args['name'] = 'changed'
+
+        # cached result must not be affected by changes to returned args
+        prefix, module, func, args = rt.find_route('get', '/joe')
+        assert func.__name__ == 'user'
+        assert args == {'name': 'joe'}
+
+        assert rt.find_route('get', '/joe/nowhere') == (None, None, None, None)
+        # misses are not cached
+        assert ('get', '/joe/nowhere') not in rt._route_cache
+
+        # adding routes resets the cache
+        rt.add_route('get', '/joe', 0, generate_route_func('joe'))
+        rt.setup()
+        prefix, module, func, args = rt.find_route('get', '/joe')
+        assert func.__name__ == 'joe'
+        assert args == {}
+
+
+def test_find_route_cache_size(monkeypatch):
+    monkeypatch.setattr(rw.routing, 'ROUTE_CACHE_SIZE', 2)
+    rt = rw.routing.RoutingTable('root')
+    rt.add_route('get', '/a', 0, generate_route_func('a'))
+    rt.add_route('get', '/b', 0, generate_route_func('b'))
+    rt.add_route('get', '/c', 0, generate_route_func('c'))
+    rt.setup()
+
+    scope = rw.scope.Scope()
+    with scope():
+        rt.find_route('get', '/a')
+        rt.find_route('get', '/b')
+        rt.find_route('get', '/a')
+        rt.find_route('get', '/c')
+    # "/b" is the least recently used route
+    assert list(rt._route_cache) == [('get', '/a'), ('get', '/c')]
+
+
 class MyTestCase(tornado.testing.AsyncTestCase):
     def test_rule_match(self):
         # match must be used inside scope with rw.routing:plugin activated
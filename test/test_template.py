@@ -0,0 +1,96 @@
+import jinja2
+
+import rw.template
+
+
+def create_env(templates):
+    return jinja2.Environment(
+        loader=jinja2.DictLoader(templates),
+        extensions=[rw.template.CachedPartExtension],
+    )
+
+
+def test_part_cached():
+    env = create_env({
+        'index.html': '{% part "counter" %}{{ counter() }}{% endpart %}'
+    })
+    calls = []
+
+    def counter():
+        calls.append(None)
+        return len(calls)
+
+    template = env.get_template('index.html')
+    assert template.render(counter=counter) == '1'
+    assert template.render(counter=counter) == '1'
+    assert len(calls) == 1
+
+    env.fragment_cache.clear()
+    assert template.render(counter=counter) == '2'
+
+
+def test_part_non_string_name():
+    env = create_env({
+        'index.html': '{% part 1 %}one{% endpart %}'
+    })
+    assert env.get_template('index.html').render() == 'one'
+    assert env.fragment_cache.get('1') == 'one'
+
+
+def test_part_without_cache():
+    env = create_env({
+        'index.html': '{% part "counter" %}{{ counter() }}{% endpart %}'
+    })
+    env.fragment_cache = None
+    calls = []
+
+    def counter():
+        calls.append(None)
+        return len(calls)
+
+    template = env.get_template('index.html')
+    assert template.render(counter=counter) == '1'
+    assert template.render(counter=counter) == '2'
+
+
+def test_fragment_cache():
+    cache = rw.template.FragmentCache(maxsize=2)
+    cache.add('a', 1)
+    cache.add('b', 2)
+    assert cache.get('a') == 1
+    cache.add('c', 3)
+    # "b" is the least recently used entry
+    assert cache.get('b') is None
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3
+
+    cache.add('expired', 4, timeout=-1)
+    assert cache.get('expired') is None
+
+
+def test_part_parse():
+    env = create_env({
+        'index.html': 'a{% part "x", 60 %}b{% endpart %}c'
+                      '{% part "y" %}d{% endpart %}e'
+    })
+    template = env.get_template('index.html')
+    # everything after the parts must still be parsed and rendered
+    assert template.render() == 'abcde'
+    assert env.fragment_cache.get('x') == 'b'
+    assert env.fragment_cache.get('y') == 'd'
+
+
+def test_precompile(tmpdir):
+    cfg = {
+        'auto_reload': False,
+        'cache_size': -1,
+        'bytecode_cache': str(tmpdir.join('bytecode')),
+    }
+    env = rw.template.create_template_env(['test.example'], cfg)
+    assert not env.auto_reload
+
+    rw.template.precompile(env)
+    templates = env.list_templates(extensions=['html'])
+    assert templates
+    assert len(env.cache) == len(templates)
+    assert len(tmpdir.join('bytecode').listdir()) == len(templates)